@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Programmatic grader for human-voice-writer eval assertions."""
 
+import functools
 import json
 import re
 import os
@@ -17,6 +18,9 @@ BANNED_WORDS = [
 
 BANNED_WORDS_EXTENDED = BANNED_WORDS + ["empowers", "empower", "unlock", "unlocking"]
 
+# Stems the de-AI marketing rewrite must keep (eval 2)
+MEANING_KEYWORDS = ("collaborat", "team", "ai", "workflow", "productiv")
+
 BANNED_OPENINGS = [
     r"^in today's rapidly evolving",
     r"^in the realm of",
@@ -31,12 +35,78 @@ BANNED_OPENINGS = [
 ]
 
 
+def compile_any(patterns, flags=0):
+    """Fuse a list of patterns into one alternation so text is scanned once."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_words(words):
+    """Whole-word alternation over every word, for a single any-of check."""
+    return re.compile(r'\b(?:' + '|'.join(re.escape(w.lower()) for w in words) + r')\b')
+
+
+BANNED_OPENING_RE = compile_any(BANNED_OPENINGS)
+
+FALSE_REVELATION_RE = compile_any(
+    (
+        r"it'?s not just .+?, it'?s",
+        r"this isn'?t just .+?, it'?s",
+        r"that'?s not .+?, it'?s",
+        r"it'?s not about .+?, it'?s about",
+        r"it'?s more than just .+?, it'?s",
+        r"not only .+?, but also",
+        r"are not just .+? \u2014 they are",
+        r"not just .+? — they",
+    ),
+    re.IGNORECASE,
+)
+
+SYCOPHANTIC_RE = compile_any(
+    (
+        r"great question",
+        r"excellent point",
+        r"let'?s break this down",
+        r"here'?s the thing",
+        r"let me explain",
+        r"let'?s dive in",
+        r"let'?s unpack this",
+    )
+)
+
+NEGATION_RE = compile_any(
+    (
+        r"\b(aren'?t|isn'?t|wasn'?t|weren'?t|don'?t|didn'?t|won'?t|can'?t|couldn'?t)\b",
+        r"\b(not|never|no longer)\b",
+    ),
+    re.IGNORECASE,
+)
+
+NEWLINES_RE = re.compile(r'\n+')
+SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+FALSE_CHOICE_RE = re.compile(r"whether you'?re .+? or .+?", re.IGNORECASE)
+TRAILING_PARTICIPIAL_RE = re.compile(r',\s+\w+ing\s+[\w\s]+[.!?]')
+CONTRACTION_RE = re.compile(r"\b\w+'(re|t|s|ve|ll|d|m)\b")
+BULLET_RE = re.compile(r'^[-*]\s')
+DRAMATIC_NEGATION_RE = re.compile(r"\b(that'?s not|this isn'?t|it'?s not|it wasn'?t|that wasn'?t)\b", re.IGNORECASE)
+CORRECTION_START_RE = re.compile(r"^(they'?re|it'?s|he'?s|she'?s|it was|they were|it is|they are)\b", re.IGNORECASE)
+STOPPED_BEING_RE = re.compile(r"stopped being|is no longer|ceased to be", re.IGNORECASE)
+IT_IS_NOW_RE = re.compile(r"^(it'?s|it is|it became)", re.IGNORECASE)
+ENSURES_RE = re.compile(r'\bensures?\b', re.IGNORECASE)
+EMOJI_SHORTCODE_RE = re.compile(r':\w+:')
+
+
+@functools.lru_cache(maxsize=32)
 def get_sentences(text):
-    """Split text into sentences."""
-    text = re.sub(r'\n+', ' ', text)
-    text = re.sub(r'#.*?\n', '', text)
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-    return [s for s in sentences if len(s.strip()) > 0]
+    """Split text into sentences.
+
+    Cached because one grading pass asks for the same text's sentences more
+    than once (burstiness and negation checks); returns a tuple so the shared
+    result can't be mutated by a caller.
+    """
+    text = NEWLINES_RE.sub(' ', text)
+    sentences = SENTENCE_BREAK_RE.split(text.strip())
+    return tuple(s for s in sentences if len(s.strip()) > 0)
 
 
 def word_count(text):
@@ -52,6 +122,10 @@ def has_banned_words(text, word_list=None):
     if word_list is None:
         word_list = BANNED_WORDS
     text_lower = text.lower()
+    # Fused pattern only rejects clean text; words can overlap ("ensure",
+    # "ensure that"), so each one is still checked on its own
+    if not compile_words(tuple(word_list)).search(text_lower):
+        return []
     found = []
     for word in word_list:
         pattern = r'\b' + re.escape(word.lower()) + r'\b'
@@ -73,31 +147,16 @@ def has_em_dashes(text):
 
 
 def has_false_revelation(text):
-    patterns = [
-        r"it'?s not just .+?, it'?s",
-        r"this isn'?t just .+?, it'?s",
-        r"that'?s not .+?, it'?s",
-        r"it'?s not about .+?, it'?s about",
-        r"it'?s more than just .+?, it'?s",
-        r"not only .+?, but also",
-        r"are not just .+? \u2014 they are",
-        r"not just .+? — they",
-    ]
-    for p in patterns:
-        if re.search(p, text, re.IGNORECASE):
-            return True
-    return False
+    return bool(FALSE_REVELATION_RE.search(text))
 
 
 def has_false_choice(text):
-    pattern = r"whether you'?re .+? or .+?"
-    return bool(re.search(pattern, text, re.IGNORECASE))
+    return bool(FALSE_CHOICE_RE.search(text))
 
 
 def has_trailing_participial(text):
     """Check for sentences ending with comma + gerund phrase."""
-    pattern = r',\s+\w+ing\s+[\w\s]+[.!?]'
-    matches = re.findall(pattern, text)
+    matches = TRAILING_PARTICIPIAL_RE.findall(text)
     real_matches = []
     for m in matches:
         # Filter out short ones that might be false positives
@@ -109,17 +168,23 @@ def has_trailing_participial(text):
 
 def count_paragraphs(text):
     """Count non-empty paragraphs (ignoring title lines starting with #)."""
-    lines = text.strip().split('\n')
-    # Remove title lines
-    lines = [l for l in lines if not l.startswith('#')]
-    text_no_titles = '\n'.join(lines)
-    paragraphs = [p.strip() for p in text_no_titles.split('\n\n') if p.strip()]
-    return len(paragraphs)
+    # One walk over the lines instead of filter, re-join and re-split:
+    # a paragraph is a run of lines between empty lines with some text in it.
+    count = 0
+    in_paragraph = False
+    for line in text.strip().split('\n'):
+        if line.startswith('#'):
+            continue
+        if not line:
+            in_paragraph = False
+        elif not in_paragraph and line.strip():
+            in_paragraph = True
+            count += 1
+    return count
 
 
 def has_contractions(text):
-    contraction_pattern = r"\b\w+'(re|t|s|ve|ll|d|m)\b"
-    return bool(re.search(contraction_pattern, text))
+    return bool(CONTRACTION_RE.search(text))
 
 
 def has_headers_or_bullets(text):
@@ -128,26 +193,15 @@ def has_headers_or_bullets(text):
         stripped = line.strip()
         if stripped.startswith('#'):
             return True
-        if re.match(r'^[-*]\s', stripped):
+        # Cheap first-character test before handing the line to the regex
+        if stripped[:1] in ('-', '*') and BULLET_RE.match(stripped):
             return True
     return False
 
 
 def has_sycophantic_or_signpost(text):
-    patterns = [
-        r"great question",
-        r"excellent point",
-        r"let'?s break this down",
-        r"here'?s the thing",
-        r"let me explain",
-        r"let'?s dive in",
-        r"let'?s unpack this",
-    ]
     text_lower = text.lower()
-    for p in patterns:
-        if re.search(p, text_lower):
-            return True
-    return False
+    return bool(SYCOPHANTIC_RE.search(text_lower))
 
 
 def has_negation_assertion(text):
@@ -158,59 +212,54 @@ def has_negation_assertion(text):
     2. Negation-correction pairs across sentences: "They aren't X. They're Y." "This wasn't luck. It was strategy."
     3. Saying what something *isn't* before what it *is*: "Remote work stopped being a perk. It's infrastructure now."
     """
-    found = []
-
-    # 1. Short dramatic negations (standalone short sentences with negation)
-    sentences = get_sentences(text)
-    for s in sentences:
-        s_stripped = s.strip().rstrip('.!?')
-        words = s_stripped.split()
+    dramatic, pairs, shifts = [], [], []
+
+    # One walk over the sentences; each check keeps its own list so the
+    # findings still come out grouped by sub-pattern.
+    sentences = [s.strip() for s in get_sentences(text)]
+    last = len(sentences) - 1
+    for i, s1 in enumerate(sentences):
+        # 1. Short dramatic negations (standalone short sentences with negation)
+        s_stripped = s1.rstrip('.!?')
         # Short sentence (2-6 words) that's a negation used as a punchline
-        if 2 <= len(words) <= 6:
-            if re.search(r"\b(that'?s not|this isn'?t|it'?s not|it wasn'?t|that wasn'?t)\b", s_stripped, re.IGNORECASE):
-                found.append(f"Dramatic negation: \"{s.strip()}\"")
-
-    # 2. Negation-correction pairs (negation sentence followed by correction)
-    for i in range(len(sentences) - 1):
-        s1 = sentences[i].strip()
-        s2 = sentences[i+1].strip()
-        # First sentence has negation
-        neg_patterns = [
-            r"\b(aren'?t|isn'?t|wasn'?t|weren'?t|don'?t|didn'?t|won'?t|can'?t|couldn'?t)\b",
-            r"\b(not|never|no longer)\b",
-        ]
-        has_neg = any(re.search(p, s1, re.IGNORECASE) for p in neg_patterns)
-        # Second sentence is a correction/assertion (starts with they're, it's, he's, she's, etc.)
-        correction_start = re.match(r"^(they'?re|it'?s|he'?s|she'?s|it was|they were|it is|they are)\b", s2, re.IGNORECASE)
+        if 2 <= len(s_stripped.split()) <= 6:
+            if DRAMATIC_NEGATION_RE.search(s_stripped):
+                dramatic.append(f"Dramatic negation: \"{s1}\"")
 
-        if has_neg and correction_start and len(s1.split()) <= 15:
-            found.append(f"Negation-correction pair: \"{s1}\" → \"{s2[:50]}...\"")
+        if i == last:
+            break
+        s2 = sentences[i + 1]
 
-    # 3. "stopped being X / It's Y now" pattern
-    for i in range(len(sentences) - 1):
-        s1 = sentences[i].strip()
-        s2 = sentences[i+1].strip()
-        if re.search(r"stopped being|is no longer|ceased to be", s1, re.IGNORECASE):
-            if re.search(r"^(it'?s|it is|it became)", s2, re.IGNORECASE):
-                found.append(f"What-it-isn't-then-what-it-is: \"{s1}\" → \"{s2[:50]}\"")
+        # 2. Negation-correction pairs (negation sentence followed by correction)
+        # Second sentence is a correction/assertion (starts with they're, it's, he's, she's, etc.)
+        if (len(s1.split()) <= 15
+                and NEGATION_RE.search(s1)
+                and CORRECTION_START_RE.match(s2)):
+            pairs.append(f"Negation-correction pair: \"{s1}\" → \"{s2[:50]}...\"")
 
-    return found
+        # 3. "stopped being X / It's Y now" pattern
+        if STOPPED_BEING_RE.search(s1) and IT_IS_NOW_RE.search(s2):
+            shifts.append(f"What-it-isn't-then-what-it-is: \"{s1}\" → \"{s2[:50]}\"")
+
+    return dramatic + pairs + shifts
 
 
 def has_banned_opening(text):
-    # Get first real line of text (skip blank lines and titles)
-    lines = text.strip().split('\n')
+    # Get first real line of text (skip blank lines and titles). Walk the
+    # newlines with find() so only the lines before the opening are sliced.
     first_line = ''
-    for line in lines:
-        stripped = line.strip()
+    start = 0
+    while start <= len(text):
+        end = text.find('\n', start)
+        if end == -1:
+            end = len(text)
+        stripped = text[start:end].strip()
         if stripped and not stripped.startswith('#'):
             first_line = stripped
             break
+        start = end + 1
     first_lower = first_line.lower()
-    for pattern in BANNED_OPENINGS:
-        if re.search(pattern, first_lower):
-            return True
-    return False
+    return bool(BANNED_OPENING_RE.search(first_lower))
 
 
 def grade_eval1(text, config):
@@ -305,8 +354,8 @@ def grade_eval2(text, config):
     })
 
     # 3. Preserves meaning
-    keywords = ["collaborat", "team", "ai", "workflow", "productiv"]
-    found_kw = [kw for kw in keywords if kw in text.lower()]
+    text_lower = text.lower()
+    found_kw = [kw for kw in MEANING_KEYWORDS if kw in text_lower]
     results.append({
         "text": "Output preserves the original meaning (collaboration, teams, AI workflows, productivity)",
         "passed": len(found_kw) >= 3,
@@ -338,7 +387,7 @@ def grade_eval2(text, config):
     })
 
     # 7. "ensures" removed
-    has_ensures = bool(re.search(r'\bensures?\b', text, re.IGNORECASE))
+    has_ensures = bool(ENSURES_RE.search(text))
     results.append({
         "text": "The word 'ensures' has been replaced or removed",
         "passed": not has_ensures,
@@ -354,7 +403,7 @@ def grade_eval3(text, config):
 
     # 1. Under 50 words
     # Strip emoji shortcodes for word count
-    clean = re.sub(r':\w+:', '', text)
+    clean = EMOJI_SHORTCODE_RE.sub('', text)
     wc = word_count(clean.strip())
     results.append({
         "text": "Output is under 50 words total",
@@ -435,9 +484,11 @@ def write_grading(eval_dir, eval_id, config):
 
     # Load timing if available
     timing_path = os.path.join(eval_dir, config, 'timing.json')
-    if os.path.exists(timing_path):
+    try:
         with open(timing_path) as f:
             grading['timing'] = json.load(f)
+    except FileNotFoundError:
+        pass
 
     grading_path = os.path.join(eval_dir, config, 'grading.json')
     with open(grading_path, 'w') as f:
@@ -466,11 +517,13 @@ if __name__ == '__main__':
         for config in ['with_skill', 'without_skill']:
             grading = write_grading(eval_dir, eval_id, config)
             s = grading['summary']
-            print(f"\n{eval_name} / {config}: {s['passed']}/{s['total']} passed ({s['pass_rate']*100:.0f}%)")
+            # Buffer the block and emit it in one write
+            out = [f"\n{eval_name} / {config}: {s['passed']}/{s['total']} passed ({s['pass_rate']*100:.0f}%)"]
             for exp in grading['expectations']:
                 status = 'PASS' if exp['passed'] else 'FAIL'
-                print(f"  [{status}] {exp['text']}")
-                print(f"         {exp['evidence']}")
+                out.append(f"  [{status}] {exp['text']}")
+                out.append(f"         {exp['evidence']}")
+            sys.stdout.write('\n'.join(out) + '\n')
 
     print("\n" + "=" * 60)
     print("Grading complete. Results saved to grading.json files.")
@@ -40,16 +40,18 @@ CATEGORY_TAGLINES = {
 }
 
 
+SLUG_TABLE = str.maketrans({
+    "&": "and",
+    ",": None,
+    "!": None,
+    "?": None,
+    "'": None,
+    " ": "-",
+})
+
+
 def slug(s):
-    return (
-        s.lower()
-        .replace("&", "and")
-        .replace(",", "")
-        .replace("!", "")
-        .replace("?", "")
-        .replace("'", "")
-        .replace(" ", "-")
-    )
+    return s.lower().translate(SLUG_TABLE)
 
 
 def render_tactic(c):
@@ -128,7 +130,7 @@ def write_index(cards):
     file_for = {
         "system": None,
         "recipe": "recipes.md",
-        **{k: v for k, v in CATEGORY_FILES.items()},
+        **CATEGORY_FILES,
     }
 
     for cat in category_order: